@@ -9,8 +9,13 @@ import datetime as dt
 import json
 import os
 import re
+import subprocess
 import sys
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -33,83 +38,24 @@ LOCKED = {
 
 # Icon (16x16 PNG)
 ICON_B64 = (
-    "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAQAAAC1+jfqAAAAJElEQVR4AWP8z8Dwn4GBgYGJ"
-    "gYGBoYHhP0YGBgYGAEo5A6oE9g8pAAAAAElFTkSuQmCC"
+    b"iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAQAAAC1+jfqAAAAJElEQVR4AWP8z8Dwn4GBgYGJ"
+    b"gYGBoYHhP0YGBgYGAEo5A6oE9g8pAAAAAElFTkSuQmCC"
 )
+_ICON_PNG = base64.b64decode(ICON_B64)
 
-
-def slugify_modid(s: str) -> str:
-    """Sanitize mod_id for Fabric (lowercase, a-z0-9-_)"""
-    s = re.sub(r'[^a-z0-9_-]', '', s.lower().replace(' ', '_'))
-    s = re.sub(r'[_-]+', lambda m: m.group()[0], s).strip('_-')
-    if not s or not s[0].isalpha():
-        s = 'c' + s.lstrip('0123456789_-')
-    return (s or 'cbclient')[:64]
-
-
-def safe_pkg(s: str) -> str:
-    """Sanitize Java package name"""
-    s = re.sub(r'[^a-z0-9_.]', '', s.lower().replace('-', '_').replace(' ', '_'))
-    parts = [p for p in re.sub(r'\.+', '.', s).strip('.').split('.') if p]
-    return '.'.join(p if p[0].isalpha() or p[0] == '_' else 'p' + p for p in parts) or 'com.example'
-
-
-def write_file(path: Path, content: str | bytes) -> None:
-    """Write file with parent directory creation"""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if isinstance(content, bytes):
-        path.write_bytes(content)
-    else:
-        path.write_text(content.strip() + '\n', encoding='utf-8')
+# Precompiled sanitizer patterns
+_MODID_BAD = re.compile(r'[^a-z0-9_-]')
+_MODID_RUNS = re.compile(r'([_-])[_-]+')
+_PKG_BAD = re.compile(r'[^a-z0-9_.]')
+_PKG_DOTS = re.compile(r'\.+')
+_PROJECT_BAD = re.compile(r'[^\w\-. ]')
+_MODID_TRANS = str.maketrans({' ': '_'})
+_PKG_TRANS = str.maketrans({' ': '_', '-': '_'})
 
 
-@dataclass
-class Meta:
-    out_dir: Path
-    project_name: str
-    client_name: str
-    mod_id: str
-    maven_group: str
-    mod_version: str
-    authors: tuple[str, ...]
-    description: str
-    license_name: str
-
-    @property
-    def base_package(self) -> str:
-        return safe_pkg(f"{self.maven_group}.{self.mod_id}")
-
-    def normalized(self) -> "Meta":
-        return Meta(
-            out_dir=self.out_dir,
-            project_name=re.sub(r'[^\w\-. ]', '', self.project_name).strip() or 'CBClient',
-            client_name=self.client_name.strip() or 'CBClient',
-            mod_id=slugify_modid(self.mod_id),
-            maven_group=safe_pkg(self.maven_group),
-            mod_version=self.mod_version.strip() or '0.1.0',
-            authors=tuple(a.strip() for a in self.authors if a.strip()) or ('Unknown',),
-            description=(self.description or f"{self.client_name} - Fabric client mod").strip(),
-            license_name=self.license_name.strip() or 'MIT',
-        )
-
-
-def generate(meta: Meta, log_cb=None) -> Path:
-    """Generate Fabric mod template"""
-    meta = meta.normalized()
-    root = meta.out_dir / meta.project_name
-    
-    if root.exists() and any(root.iterdir()):
-        root = meta.out_dir / f"{meta.project_name}_{dt.datetime.now():%Y%m%d_%H%M%S}"
-    
-    log = log_cb or print
-    log(f"Generating: {root}")
-
-    # Helper for template rendering
-    def t(template: str, **kw) -> str:
-        return template.format(**{**LOCKED, **kw}).strip()
-
-    # Root files
-    write_file(root / "settings.gradle", t("""
+# File templates (str.format syntax, rendered against LOCKED + per-project values)
+_RAW_TEMPLATES = {
+    "settings.gradle": """
         pluginManagement {{
             repositories {{
                 maven {{ url = 'https://maven.fabricmc.net/' }}
@@ -117,9 +63,9 @@ def generate(meta: Meta, log_cb=None) -> Path:
             }}
         }}
         rootProject.name = '{project_name}'
-    """, project_name=meta.project_name))
+    """,
 
-    write_file(root / "gradle.properties", t("""
+    "gradle.properties": """
         org.gradle.jvmargs=-Xmx2G -Dfile.encoding=UTF-8
         org.gradle.parallel=true
         minecraft_version={minecraft_version}
@@ -130,9 +76,9 @@ def generate(meta: Meta, log_cb=None) -> Path:
         maven_group={maven_group}
         archives_base_name={mod_id}
         mod_version={mod_version}
-    """, maven_group=meta.maven_group, mod_id=meta.mod_id, mod_version=meta.mod_version))
+    """,
 
-    write_file(root / "build.gradle", t("""
+    "build.gradle": """
         plugins {{
             id 'fabric-loom' version '{loom_version}'
             id 'maven-publish'
@@ -167,65 +113,18 @@ def generate(meta: Meta, log_cb=None) -> Path:
             inputs.property "version", project.version
             filesMatching("fabric.mod.json") {{ expand "version": project.version }}
         }}
-    """))
+    """,
 
-    write_file(root / ".gitignore", ".gradle/\nbuild/\nout/\n.idea/\n*.iml\nrun/\nlogs/")
-    
-    write_file(root / "README.md", t("""
+    "README.md": """
         # {client_name} (Fabric {minecraft_version})
         
         Run: `./gradlew runClient` (or `.\\gradlew.bat runClient` on Windows)
         Build: `./gradlew build`
         
         Press Right Shift in-game to open GUI.
-    """, client_name=meta.client_name))
-
-    # Resources
-    res = root / "src/main/resources"
-    
-    write_file(res / "fabric.mod.json", json.dumps({
-        "schemaVersion": 1,
-        "id": meta.mod_id,
-        "version": "${version}",
-        "name": meta.client_name,
-        "description": meta.description,
-        "authors": list(meta.authors),
-        "license": meta.license_name,
-        "icon": f"assets/{meta.mod_id}/icon.png",
-        "environment": "client",
-        "entrypoints": {"client": [f"{meta.base_package}.CBClient"]},
-        "mixins": [f"{meta.mod_id}.mixins.json"],
-        "depends": {
-            "fabricloader": ">=0.18.0",
-            "minecraft": f"={LOCKED['minecraft_version']}",
-            "java": f">={LOCKED['java_version']}",
-            "fabric-api": "*"
-        }
-    }, indent=2))
-
-    write_file(res / f"{meta.mod_id}.mixins.json", json.dumps({
-        "required": True,
-        "minVersion": "0.8",
-        "package": f"{meta.base_package}.mixin",
-        "compatibilityLevel": f"JAVA_{LOCKED['java_version']}",
-        "client": ["MinecraftClientMixin"],
-        "injectors": {"defaultRequire": 1}
-    }, indent=2))
-
-    # Lang files
-    lang_dir = res / f"assets/{meta.mod_id}/lang"
-    write_file(lang_dir / "en_us.json", json.dumps({
-        f"key.{meta.mod_id}.open_gui": f"Open {meta.client_name} GUI",
-        f"category.{meta.mod_id}": meta.client_name
-    }, indent=2))
+    """,
 
-    write_file(res / f"assets/{meta.mod_id}/icon.png", base64.b64decode(ICON_B64))
-
-    # Java sources
-    java_root = root / f"src/main/java/{meta.base_package.replace('.', '/')}"
-    pkg = meta.base_package
-
-    write_file(java_root / "CBClient.java", t("""
+    "CBClient.java": """
         package {pkg};
         import {pkg}.module.ModuleManager;
         import {pkg}.gui.ClientScreen;
@@ -260,10 +159,9 @@ def generate(meta: Meta, log_cb=None) -> Path:
                 }});
             }}
         }}
-    """, pkg=pkg, mod_id=meta.mod_id, client_name=meta.client_name))
+    """,
 
-    # Module system
-    write_file(java_root / "module/Module.java", t("""
+    "Module.java": """
         package {pkg}.module;
         public abstract class Module {{
             private final String name;
@@ -281,9 +179,9 @@ def generate(meta: Meta, log_cb=None) -> Path:
             protected void onEnable() {{}}
             protected void onDisable() {{}}
         }}
-    """, pkg=pkg))
+    """,
 
-    write_file(java_root / "module/ModuleManager.java", t("""
+    "ModuleManager.java": """
         package {pkg}.module;
         import java.util.*;
         public final class ModuleManager {{
@@ -291,9 +189,9 @@ def generate(meta: Meta, log_cb=None) -> Path:
             public static void init() {{ MODULES.add(new ExampleModule()); }}
             public static List<Module> all() {{ return Collections.unmodifiableList(MODULES); }}
         }}
-    """, pkg=pkg))
+    """,
 
-    write_file(java_root / "module/ExampleModule.java", t("""
+    "ExampleModule.java": """
         package {pkg}.module;
         import {pkg}.CBClient;
         public class ExampleModule extends Module {{
@@ -301,10 +199,9 @@ def generate(meta: Meta, log_cb=None) -> Path:
             @Override protected void onEnable() {{ CBClient.LOGGER.info("Example ON"); }}
             @Override protected void onDisable() {{ CBClient.LOGGER.info("Example OFF"); }}
         }}
-    """, pkg=pkg))
+    """,
 
-    # GUI
-    write_file(java_root / "gui/ClientScreen.java", t("""
+    "ClientScreen.java": """
         package {pkg}.gui;
         import {pkg}.module.*;
         import net.minecraft.client.gui.screen.Screen;
@@ -330,10 +227,9 @@ def generate(meta: Meta, log_cb=None) -> Path:
                 return Text.of(m.getName() + " : " + (m.isEnabled() ? "ON" : "OFF"));
             }}
         }}
-    """, pkg=pkg))
+    """,
 
-    # Mixin
-    write_file(java_root / "mixin/MinecraftClientMixin.java", t("""
+    "MinecraftClientMixin.java": """
         package {pkg}.mixin;
         import {pkg}.CBClient;
         import net.minecraft.client.MinecraftClient;
@@ -348,28 +244,239 @@ def generate(meta: Meta, log_cb=None) -> Path:
                 cir.setReturnValue(CBClient.CLIENT_NAME + " | {minecraft_version}");
             }}
         }}
-    """, pkg=pkg))
+    """,
+}
+_TEMPLATES = {name: textwrap.dedent(src).strip() + '\n' for name, src in _RAW_TEMPLATES.items()}
+
+
+def slugify_modid(s: str) -> str:
+    """Sanitize mod_id for Fabric (lowercase, a-z0-9-_)"""
+    s = _MODID_BAD.sub('', s.lower().translate(_MODID_TRANS))
+    s = _MODID_RUNS.sub(r'\1', s).strip('_-')
+    if not s or not s[0].isalpha():
+        s = 'c' + s.lstrip('0123456789_-')
+    return (s or 'cbclient')[:64]
+
+
+def safe_pkg(s: str) -> str:
+    """Sanitize Java package name"""
+    s = _PKG_BAD.sub('', s.lower().translate(_PKG_TRANS))
+    parts = [p for p in _PKG_DOTS.sub('.', s).strip('.').split('.') if p]
+    return '.'.join(p if p[0].isalpha() or p[0] == '_' else 'p' + p for p in parts) or 'com.example'
+
 
+def _nonempty(p: Path) -> bool:
+    """True if directory p exists and has at least one entry"""
+    try:
+        with os.scandir(p) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return False
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write data to a temp file with raw os.write, then rename over path"""
+    tmp = path + '.tmp'
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_file(path: str, content: str | bytes) -> None:
+    """Write file (parent directory must already exist)"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    _atomic_write(path, content)
+
+
+def write_files(writes: list[tuple[str, str | bytes]]) -> None:
+    """Create each unique parent directory once, then write files concurrently"""
+    for parent in {os.path.dirname(path) for path, _ in writes}:
+        os.makedirs(parent, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(lambda pc: write_file(*pc), writes))
+
+
+@lru_cache(maxsize=32)
+def _fabric_mod_json(mod_id: str, name: str, desc: str, authors: tuple[str, ...],
+                     license_name: str, pkg: str) -> str:
+    return json.dumps({
+        "schemaVersion": 1,
+        "id": mod_id,
+        "version": "${version}",
+        "name": name,
+        "description": desc,
+        "authors": list(authors),
+        "license": license_name,
+        "icon": f"assets/{mod_id}/icon.png",
+        "environment": "client",
+        "entrypoints": {"client": [f"{pkg}.CBClient"]},
+        "mixins": [f"{mod_id}.mixins.json"],
+        "depends": {
+            "fabricloader": ">=0.18.0",
+            "minecraft": f"={LOCKED['minecraft_version']}",
+            "java": f">={LOCKED['java_version']}",
+            "fabric-api": "*"
+        }
+    }, indent=2) + '\n'
+
+
+@lru_cache(maxsize=32)
+def _mixins_json(pkg: str) -> str:
+    return json.dumps({
+        "required": True,
+        "minVersion": "0.8",
+        "package": f"{pkg}.mixin",
+        "compatibilityLevel": f"JAVA_{LOCKED['java_version']}",
+        "client": ["MinecraftClientMixin"],
+        "injectors": {"defaultRequire": 1}
+    }, indent=2) + '\n'
+
+
+@lru_cache(maxsize=32)
+def _lang_json(mod_id: str, client_name: str) -> str:
+    return json.dumps({
+        f"key.{mod_id}.open_gui": f"Open {client_name} GUI",
+        f"category.{mod_id}": client_name
+    }, indent=2) + '\n'
+
+
+@dataclass(frozen=True)
+class Meta:
+    out_dir: Path
+    project_name: str
+    client_name: str
+    mod_id: str
+    maven_group: str
+    mod_version: str
+    authors: tuple[str, ...]
+    description: str
+    license_name: str
+
+    @cached_property
+    def base_package(self) -> str:
+        return safe_pkg(f"{self.maven_group}.{self.mod_id}")
+
+    def normalized(self) -> "Meta":
+        return Meta(
+            out_dir=self.out_dir,
+            project_name=_PROJECT_BAD.sub('', self.project_name).strip() or 'CBClient',
+            client_name=self.client_name.strip() or 'CBClient',
+            mod_id=slugify_modid(self.mod_id),
+            maven_group=safe_pkg(self.maven_group),
+            mod_version=self.mod_version.strip() or '0.1.0',
+            authors=tuple(a.strip() for a in self.authors if a.strip()) or ('Unknown',),
+            description=(self.description or f"{self.client_name} - Fabric client mod").strip(),
+            license_name=self.license_name.strip() or 'MIT',
+        )
+
+
+def generate(meta: Meta, log_cb=None) -> Path:
+    """Generate Fabric mod template"""
+    meta = meta.normalized()
+    root = meta.out_dir / meta.project_name
+    
+    if _nonempty(root):
+        root = meta.out_dir / f"{meta.project_name}_{dt.datetime.now():%Y%m%d_%H%M%S}"
+    
+    log = log_cb or print
+    log(f"Generating: {root}")
+
+    pkg = meta.base_package
+    ctx = {
+        **LOCKED,
+        'pkg': pkg,
+        'project_name': meta.project_name,
+        'client_name': meta.client_name,
+        'mod_id': meta.mod_id,
+        'maven_group': meta.maven_group,
+        'mod_version': meta.mod_version,
+    }
+
+    def render(name: str) -> str:
+        return _TEMPLATES[name].format_map(ctx)
+
+    writes: list[tuple[str, str | bytes]] = []
+
+    def queue_write(path: str, content: str | bytes) -> None:
+        writes.append((path, content))
+
+    # Root files
+    root_s = str(root)
+    queue_write(os.path.join(root_s, "settings.gradle"), render("settings.gradle"))
+    queue_write(os.path.join(root_s, "gradle.properties"), render("gradle.properties"))
+    queue_write(os.path.join(root_s, "build.gradle"), render("build.gradle"))
+    queue_write(os.path.join(root_s, ".gitignore"), ".gradle/\nbuild/\nout/\n.idea/\n*.iml\nrun/\nlogs/\n")
+    queue_write(os.path.join(root_s, "README.md"), render("README.md"))
+
+    # Resources
+    res = os.path.join(root_s, "src/main/resources")
+    
+    queue_write(os.path.join(res, "fabric.mod.json"), _fabric_mod_json(
+        meta.mod_id, meta.client_name, meta.description, meta.authors, meta.license_name, pkg))
+    queue_write(os.path.join(res, f"{meta.mod_id}.mixins.json"), _mixins_json(pkg))
+
+    # Lang files
+    lang_dir = os.path.join(res, f"assets/{meta.mod_id}/lang")
+    queue_write(os.path.join(lang_dir, "en_us.json"), _lang_json(meta.mod_id, meta.client_name))
+
+    queue_write(os.path.join(res, f"assets/{meta.mod_id}/icon.png"), _ICON_PNG)
+
+    # Java sources
+    java_root = os.path.join(root_s, "src/main/java", pkg.replace('.', '/'))
+
+    queue_write(os.path.join(java_root, "CBClient.java"), render("CBClient.java"))
+
+    # Module system
+    queue_write(os.path.join(java_root, "module/Module.java"), render("Module.java"))
+    queue_write(os.path.join(java_root, "module/ModuleManager.java"), render("ModuleManager.java"))
+    queue_write(os.path.join(java_root, "module/ExampleModule.java"), render("ExampleModule.java"))
+
+    # GUI
+    queue_write(os.path.join(java_root, "gui/ClientScreen.java"), render("ClientScreen.java"))
+
+    # Mixin
+    queue_write(os.path.join(java_root, "mixin/MinecraftClientMixin.java"), render("MinecraftClientMixin.java"))
+
+    write_files(writes)
     log("Done.")
     return root
 
 
+class _Fields:
+    """Tk variables backing the form entries"""
+    __slots__ = ('out', 'project', 'client', 'modid', 'group', 'version', 'authors', 'license')
+
+    def __init__(self):
+        self.out = tk.StringVar(value=str(Path.cwd()))
+        self.project = tk.StringVar(value="CBClient_client")
+        self.client = tk.StringVar(value="CBClient")
+        self.modid = tk.StringVar(value="cbclient")
+        self.group = tk.StringVar(value="com.example")
+        self.version = tk.StringVar(value="0.1.0")
+        self.authors = tk.StringVar(value="GuilhermeBedYT")
+        self.license = tk.StringVar(value="MIT")
+
+
 class App:
     """Tkinter GUI"""
     def __init__(self, root: tk.Tk):
         self.root = root
         root.title("CBClient Generator (1.21.4)")
         
-        self.vars = {
-            'out': tk.StringVar(value=str(Path.cwd())),
-            'project': tk.StringVar(value="CBClient_client"),
-            'client': tk.StringVar(value="CBClient"),
-            'modid': tk.StringVar(value="cbclient"),
-            'group': tk.StringVar(value="com.example"),
-            'version': tk.StringVar(value="0.1.0"),
-            'authors': tk.StringVar(value="GuilhermeBedYT"),
-            'license': tk.StringVar(value="MIT"),
-        }
+        self.f = _Fields()
         self._build()
 
     def _build(self):
@@ -391,7 +498,7 @@ class App:
 
         for i, (label, key, has_btn) in enumerate(fields):
             ttk.Label(frm, text=label).grid(row=i, column=0, sticky="w", pady=2)
-            ttk.Entry(frm, textvariable=self.vars[key]).grid(row=i, column=1, sticky="ew", padx=6)
+            ttk.Entry(frm, textvariable=getattr(self.f, key)).grid(row=i, column=1, sticky="ew", padx=6)
             if has_btn:
                 cmd = self._browse_out if key == 'out' else self._fix_modid
                 ttk.Button(frm, text="..." if key == 'out' else "Fix", command=cmd).grid(row=i, column=2)
@@ -407,7 +514,8 @@ class App:
         self.preview.grid(row=len(fields)+1, column=0, columnspan=3, sticky="w", pady=8)
         
         # Buttons
-        ttk.Button(frm, text="Gerar", command=self._generate).grid(row=len(fields)+2, column=0, sticky="w")
+        self.gen_btn = ttk.Button(frm, text="Gerar", command=self._generate)
+        self.gen_btn.grid(row=len(fields)+2, column=0, sticky="w")
         ttk.Button(frm, text="Abrir pasta", command=self._open_out).grid(row=len(fields)+2, column=1, sticky="w")
 
         # Log
@@ -418,23 +526,33 @@ class App:
         self._update_preview()
 
     def _browse_out(self):
-        d = filedialog.askdirectory(initialdir=self.vars['out'].get())
+        d = filedialog.askdirectory(initialdir=self.f.out.get())
         if d:
-            self.vars['out'].set(d)
+            self.f.out.set(d)
             self._update_preview()
 
     def _fix_modid(self):
-        self.vars['modid'].set(slugify_modid(self.vars['modid'].get()))
+        self.f.modid.set(slugify_modid(self.f.modid.get()))
         self._update_preview()
 
+    def _preview_path(self) -> Path:
+        proj = _PROJECT_BAD.sub('', self.f.project.get()).strip() or 'CBClient'
+        return Path(self.f.out.get()) / proj
+
     def _update_preview(self):
-        meta = self._meta().normalized()
-        self.preview.config(text=f"→ {meta.out_dir / meta.project_name}")
+        self.preview.config(text=f"→ {self._preview_path()}")
 
     def _open_out(self):
-        p = Path(self.vars['out'].get())
-        if p.exists():
-            os.startfile(str(p)) if sys.platform == 'win32' else os.system(f'open "{p}"')
+        p = Path(self.f.out.get())
+        if not p.exists():
+            return
+        try:
+            if sys.platform == 'win32':
+                os.startfile(str(p))
+            else:
+                subprocess.Popen(['open' if sys.platform == 'darwin' else 'xdg-open', str(p)])
+        except OSError as e:
+            self._log_msg(f"Não foi possível abrir a pasta: {e}")
 
     def _log_msg(self, msg: str):
         self.log.insert("end", msg + "\n")
@@ -442,23 +560,47 @@ class App:
 
     def _meta(self) -> Meta:
         return Meta(
-            out_dir=Path(self.vars['out'].get()),
-            project_name=self.vars['project'].get(),
-            client_name=self.vars['client'].get(),
-            mod_id=self.vars['modid'].get(),
-            maven_group=self.vars['group'].get(),
-            mod_version=self.vars['version'].get(),
-            authors=tuple(self.vars['authors'].get().split(',')),
+            out_dir=Path(self.f.out.get()),
+            project_name=self.f.project.get(),
+            client_name=self.f.client.get(),
+            mod_id=self.f.modid.get(),
+            maven_group=self.f.group.get(),
+            mod_version=self.f.version.get(),
+            authors=tuple(a for a in (s.strip() for s in self.f.authors.get().split(',')) if a),
             description=self.desc.get("1.0", "end").strip(),
-            license_name=self.vars['license'].get(),
+            license_name=self.f.license.get(),
         )
 
     def _generate(self):
+        meta = self._meta()  # read Tk vars on the main thread
+        self.gen_btn.state(["disabled"])
+
+        def log(msg: str):
+            self._post(self._log_msg, msg)
+
+        def worker():
+            try:
+                out = generate(meta, log)
+            except Exception as e:
+                self._post(self._generate_done, e, None)
+            else:
+                self._post(self._generate_done, None, out)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _post(self, fn, *args):
+        """Schedule fn on the Tk thread; ignore it if the window is gone"""
         try:
-            out = generate(self._meta(), self._log_msg)
+            self.root.after(0, fn, *args)
+        except (tk.TclError, RuntimeError):
+            pass
+
+    def _generate_done(self, err: Optional[Exception], out: Optional[Path]):
+        self.gen_btn.state(["!disabled"])
+        if err is not None:
+            messagebox.showerror("Erro", str(err))
+        else:
             messagebox.showinfo("Pronto", f"Gerado em:\n{out}")
-        except Exception as e:
-            messagebox.showerror("Erro", str(e))
 
 
 def main(argv: Optional[list] = None):